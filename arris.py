@@ -38,10 +38,13 @@ class WanNetworksTable(snmp.Table):
 
     The size of this table is usually limited to 4 entries
     """
-    def __init__(self, transport):
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.1.7.1"
+
+    def __init__(self, transport, walk_result=None):
         super().__init__(
-            table_oid="1.3.6.1.4.1.4115.1.20.1.1.1.7.1",
+            table_oid=self.TABLE_OID,
             transport=transport,
+            walk_result=walk_result,
             column_mapping={
                 "1": dict(name="Index"),
                 "2": dict(name="addr_type",
@@ -84,10 +87,13 @@ class WanNetworksTable(snmp.Table):
 
 class DNSServerTable(snmp.Table):
     """List of DNS servers known/used by the hub"""
-    def __init__(self, transport):
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.1.11.2.1"
+
+    def __init__(self, transport, walk_result=None):
         super().__init__(
-            table_oid="1.3.6.1.4.1.4115.1.20.1.1.1.11.2.1",
+            table_oid=self.TABLE_OID,
             transport=transport,
+            walk_result=walk_result,
             column_mapping={
                 "1": dict(name="index",
                           translator=snmp.IntTranslator),
@@ -131,10 +137,13 @@ class LanTable(snmp.Table):
     network can span multiple interfaces.
 
     """
-    def __init__(self, transport):
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.2.2.1"
+
+    def __init__(self, transport, walk_result=None):
         super().__init__(
-            table_oid="1.3.6.1.4.1.4115.1.20.1.1.2.2.1",
+            table_oid=self.TABLE_OID,
             transport=transport,
+            walk_result=walk_result,
             column_mapping={
                 "1": dict(name="name"),
                 "27": dict(name="interfaces",
@@ -222,10 +231,13 @@ class LanClientTable(snmp.Table):
 
     Retrieving this list can take 10 seconds or more...
     """
-    def __init__(self, transport):
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.2.4.2.1"
+
+    def __init__(self, transport, walk_result=None):
         super().__init__(
-            table_oid="1.3.6.1.4.1.4115.1.20.1.1.2.4.2.1",
+            table_oid=self.TABLE_OID,
             transport=transport,
+            walk_result=walk_result,
             column_mapping={
                 "1": dict(name="addrtype",
                           translator=snmp.IPVersionTranslator),
@@ -261,9 +273,12 @@ class EtherPortTable(snmp.Table):
     """The physical ethernet ports
 
     """
-    def __init__(self, hub):
-        super().__init__(table_oid="1.3.6.1.4.1.4115.1.20.1.1.2.8.1",
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.2.8.1"
+
+    def __init__(self, hub, walk_result=None):
+        super().__init__(table_oid=self.TABLE_OID,
                          transport=hub,
+                         walk_result=walk_result,
                          column_mapping={
                              "1": dict(name="idx"),
                              "2": dict(name="if_index"),
@@ -296,9 +311,12 @@ class AccessMode(snmp.HumaneEnum):
 
 class BSSTable(snmp.Table):
     """Wifi networks"""
-    def __init__(self, hub):
-        super().__init__(table_oid="1.3.6.1.4.1.4115.1.20.1.1.3.22.1",
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.3.22.1"
+
+    def __init__(self, hub, walk_result=None):
+        super().__init__(table_oid=self.TABLE_OID,
                          transport=hub,
+                         walk_result=walk_result,
                          column_mapping={
                              "1": dict(name="mac",
                                        translator=snmp.MacAddressTranslator),
@@ -336,10 +354,13 @@ class WifiClientTable(snmp.Table):
     """Information about the currently connected WIFI clients
 
     """
-    def __init__(self, transport):
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.3.42.1"
+
+    def __init__(self, transport, walk_result=None):
         super().__init__(
-            table_oid="1.3.6.1.4.1.4115.1.20.1.1.3.42.1",
+            table_oid=self.TABLE_OID,
             transport=transport,
+            walk_result=walk_result,
             column_mapping={
                 "1": dict(name="index"),
                 "2": dict(name="ip_version",
@@ -400,9 +421,12 @@ class PortForwardTable(snmp.Table):
         Traffic arriving from the WAN will be forwarded to the internal
         servers as per the mapping.
     """
-    def __init__(self, hub):
-        super().__init__(table_oid="1.3.6.1.4.1.4115.1.20.1.1.4.12.1",
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.4.12.1"
+
+    def __init__(self, hub, walk_result=None):
+        super().__init__(table_oid=self.TABLE_OID,
                          transport=hub,
+                         walk_result=walk_result,
                          column_mapping={
                              "11": dict(name="rowstatus",
                                         doc="Row status to add/remove rows",
@@ -504,9 +528,12 @@ class MSOLogTable(snmp.Table):
     the user. Assumed to be the MSO remotely or a technician.
 
     """
-    def __init__(self, transport):
-        super().__init__(table_oid="1.3.6.1.4.1.4115.1.20.1.1.5.19.2.1.1",
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.5.19.2.1.1"
+
+    def __init__(self, transport, walk_result=None):
+        super().__init__(table_oid=self.TABLE_OID,
                          transport=transport,
+                         walk_result=walk_result,
                          column_mapping={
                              "2": dict(name="stamp",
                                        translator=snmp.DateTimeTranslator),
@@ -516,9 +543,12 @@ class MSOLogTable(snmp.Table):
 class FirewallLogTable(snmp.Table):
     """The firewall log.
     """
-    def __init__(self, transport):
-        super().__init__(table_oid="1.3.6.1.4.1.4115.1.20.1.1.5.19.1.1.1",
+    TABLE_OID = "1.3.6.1.4.1.4115.1.20.1.1.5.19.1.1.1"
+
+    def __init__(self, transport, walk_result=None):
+        super().__init__(table_oid=self.TABLE_OID,
                          transport=transport,
+                         walk_result=walk_result,
                          column_mapping={
                              "1": dict(name="index",
                                        translator=snmp.IntTranslator),
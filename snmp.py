@@ -7,8 +7,13 @@ and retrieving SNMP OIDs in a pythonic way.
 See also: https://tools.ietf.org/html/rfc3781
 
 """
+import collections
+import concurrent.futures
 import datetime
 import enum
+import functools
+import struct
+import sys
 import textwrap
 import warnings
 
@@ -77,7 +82,86 @@ class AttributeStatus(HumaneEnum):
     NEEDS_WRITE = 2
     NEEDS_READ = 3
 
-class RawAttribute:
+class _AttributeDoc:
+    """Doc strings for attribute instances, built on demand.
+
+    Attributes are created in bulk (one per table cell), but their doc
+    strings are only ever read by help() and friends - so there is no
+    point in building them up front. Looking up __doc__ on the class
+    itself still gives the class doc string.
+
+    Once built, the doc string is kept in the instance's _built_doc.
+
+    """
+    def __init__(self, classdoc):
+        self._classdoc = classdoc
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self._classdoc
+        # pylint: disable=protected-access
+        doc = instance._built_doc
+        if doc is None:
+            doc = instance._built_doc = instance._docstring()
+        return doc
+
+def _snmp_write(transport, oid, value, datatype, readback_after_write):
+    """Send a (raw) value to the hub, optionally reading it back to
+    check that the hub accepted it"""
+    transport.snmp_set(oid, value, datatype)
+    if readback_after_write:
+        readback = transport.snmp_get(oid)
+        if str(readback) != str(value):
+            raise ValueError("hub did not accept a value of '{value}' for {oid}: "
+                             "It read back as '{rb}'!?"
+                             .format(value=value,
+                                     oid=oid,
+                                     rb=readback))
+
+class Writable:
+    """Base class for SNMP values which can be written to the hub -
+    attributes as well as table columns.
+
+    Writes are not read back for verification unless asked for: either
+    per value (readback_after_write=True), or for all values by setting
+    Writable.verify_writes. Subclasses can also set verify_writes, to
+    change the default for just their values.
+    """
+    __slots__ = ('_readback_after_write',)
+
+    verify_writes = False
+    """Default for readback_after_write: Whether to read values back
+    after writing them, to check that the hub accepted them"""
+
+    def __init__(self, readback_after_write=None):
+        self._readback_after_write = readback_after_write
+
+    def _readback(self):
+        """Whether to read the value back after writing it.
+
+        Unless given explicitly, this follows the class' verify_writes
+        - looked up at write time, so changing it also affects values
+        which already exist:
+
+        >>> class Transport:
+        ...     def snmp_set(self, oid, value, datatype): pass
+        ...     def snmp_get(self, oid): return "old value"
+        ...     attr = RawAttribute("1.2.3", DataType.STRING)
+        >>> Transport().attr = "new value"
+        >>> class ParanoidAttribute(RawAttribute):
+        ...     verify_writes = True
+        >>> Transport.attr = ParanoidAttribute("1.2.3", DataType.STRING)
+        >>> Transport().attr = "new value" # doctest: +ELLIPSIS
+        Traceback (most recent call last):
+        ...
+        ValueError: hub did not accept a value of 'new value' for 1.2.3: ...
+
+        """
+        if self._readback_after_write is None:
+            return type(self).verify_writes
+        return self._readback_after_write
+
+class RawAttribute(Writable):
     """An abstraction of an SNMP attribute.
 
     This behaves like a normal attribute: Reads of it will retrieve
@@ -90,20 +174,26 @@ class RawAttribute:
     This allows you to read/write the 'raw' values. For most use cases
     you probably want to use the Attribute class, as this can do
     translation.
+
+    Writes are not read back for verification unless asked for - see
+    Writable.
     """
+    __doc__ = _AttributeDoc(__doc__)
+    __slots__ = ('_oid', '_datatype', '_status', '_value', '_built_doc')
+
     def __init__(self,
                  oid,
                  datatype,
                  status=AttributeStatus.NEEDS_READ,
                  value=None,
                  instance=None,
-                 readback_after_write=True):
+                 readback_after_write=None):
         self._oid = oid
         self._datatype = datatype
         self._status = status
         self._value = value
-        self._readback_after_write = readback_after_write
-        self.__doc__ = "SNMP Attribute {0}, assumed to be datatype {1}".format(oid, datatype.name)
+        self._built_doc = None
+        Writable.__init__(self, readback_after_write)
         if self._status == AttributeStatus.NEEDS_WRITE and instance is None:
             raise TypeError("When creating attributes with NEEDS_WRITE, "
                             "instance value is mandatory")
@@ -121,28 +211,28 @@ class RawAttribute:
         """The Data Type - one of the DataType enums"""
         return self._datatype
 
+    def _docstring(self):
+        return "SNMP Attribute {0}, assumed to be datatype {1}".format(self._oid,
+                                                                      self._datatype.name)
+
     def reread(self, instance):
         """Re-read the value from the hub"""
         self._value = instance.snmp_get(self._oid)
         self._status = AttributeStatus.OK
 
     def __get__(self, instance, owner):
-        if self._status == AttributeStatus.NEEDS_READ:
+        # Cached values are by far the most common case, so check for
+        # that first
+        status = self._status
+        if status is AttributeStatus.OK:
+            return self._value
+        if status is AttributeStatus.NEEDS_READ:
             self.reread(instance)
-        elif self._status == AttributeStatus.UNSET:
-            raise AttributeError("OID '{0}' has not yet been set".format(self._oid))
-        return self._value
+            return self._value
+        raise AttributeError("OID '{0}' has not yet been set".format(self._oid))
 
     def _write(self, instance, value):
-        instance.snmp_set(self._oid, value, self._datatype)
-        if self._readback_after_write:
-            readback = instance.snmp_get(self._oid)
-            if str(readback) != str(value):
-                raise ValueError("hub did not accept a value of '{value}' for {oid}: "
-                                 "It read back as '{rb}'!?"
-                                 .format(value=value,
-                                         oid=self._oid,
-                                         rb=readback))
+        _snmp_write(instance, self._oid, value, self._datatype, self._readback())
         self._value = value
         self._status = AttributeStatus.OK
 
@@ -161,8 +251,22 @@ class Translator:
     It is a translators job to translate between SNMP values and
     Python values - both ways.
 
+    Subclasses where pyvalue() is a pure function returning immutable
+    values can set cacheable to have the results cached.
+
     """
     snmp_datatype = DataType.STRING
+    cacheable = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cacheable and 'pyvalue' in cls.__dict__:
+            pyvalue = cls.__dict__['pyvalue']
+            if isinstance(pyvalue, staticmethod):
+                cls.pyvalue = staticmethod(functools.lru_cache(maxsize=1024)(pyvalue.__func__))
+            else:
+                cls.pyvalue = functools.lru_cache(maxsize=1024)(pyvalue)
+
     @staticmethod
     def snmp(python_value):
         "Returns the python equivalent of the given SNMP value"
@@ -181,6 +285,8 @@ class NullTranslator(Translator):
     def snmp(python_value):
         if python_value is None:
             return ""
+        if python_value.__class__ is str:
+            return python_value
         return str(python_value)
     @staticmethod
     def pyvalue(snmp_value):
@@ -195,15 +301,23 @@ class EnumTranslator(Translator):
         self.snmp_datatype = snmp_datatype
         if doc:
             self.__doc__ = doc
+        # Plain dict lookups are a lot cheaper than going through the
+        # Enum machinery for every value
+        self._by_name = dict(enumclass.__members__)
+        self._by_value = {member.value: member for member in enumclass}
 
     def snmp(self, python_value):
         if not isinstance(python_value, self.enumclass):
-            python_value = self.enumclass[str(python_value)]
+            python_value = self._by_name[str(python_value)]
 
         return python_value.value
 
     def pyvalue(self, snmp_value):
-        return self.enumclass(snmp_value)
+        try:
+            return self._by_value[snmp_value]
+        except KeyError:
+            # Let the Enum raise its usual ValueError
+            return self.enumclass(snmp_value)
     @property
     def name(self):
         """The string name of the python constant"""
@@ -252,6 +366,8 @@ class IntTranslator(Translator):
 
     """
     snmp_datatype = DataType.INT
+    cacheable = True
+
     @staticmethod
     def snmp(python_value):
         """Translates an python integer to an SNMP string
@@ -271,6 +387,8 @@ class IntTranslator(Translator):
         """
         if python_value is None:
             return ""
+        if python_value.__class__ is int:
+            return str(python_value)
         return str(int(python_value))
 
     @staticmethod
@@ -301,6 +419,34 @@ class PortTranslator(IntTranslator):
     """
     snmp_datatype = DataType.PORT
 
+def _hex_to_int(digits):
+    """Convert a string of hex digits to an integer.
+
+    Unlike int(digits, 16), this is strict: signs, '0x' prefixes,
+    underscores and whitespace are all rejected.
+
+    >>> _hex_to_int('c0a80464')
+    3232236644
+    >>> _hex_to_int('123')
+    291
+    >>> _hex_to_int('0x00') # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError: non-hexadecimal number found in fromhex() arg
+    >>> _hex_to_int('00 11 22')
+    Traceback (most recent call last):
+    ...
+    ValueError: '00 11 22' is not a string of hex digits
+
+    """
+    if len(digits) % 2:
+        digits = '0' + digits
+    raw = bytes.fromhex(digits)
+    # bytes.fromhex() skips whitespace
+    if len(raw) * 2 != len(digits):
+        raise ValueError("'%s' is not a string of hex digits" % digits)
+    return int.from_bytes(raw, 'big')
+
 class MacAddressTranslator(Translator):
     """The hub represents mac addresses as e.g. "$787b8a6413f5" - i.e. a
     dollar sign followed by 12 hex digits, which we need to transform
@@ -317,6 +463,10 @@ class MacAddressTranslator(Translator):
     EUI('78:7b:8a:64:13:f5')
     >>> MacAddressTranslator.snmp(netaddr.EUI('78-7B-8A-64-13-F5'))
     '$787b8a6413f5'
+    >>> MacAddressTranslator.pyvalue('$0_1122334455') # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError: non-hexadecimal number found in fromhex() arg
 
     """
     @staticmethod
@@ -326,9 +476,9 @@ class MacAddressTranslator(Translator):
         if not snmp_value.startswith('$') or len(snmp_value) != 13:
             raise ValueError("'%s' is not a sensible SNMP Mac Address"
                              % snmp_value)
-        mac = netaddr.EUI(snmp_value[1:])
-        mac.dialect = netaddr.mac_unix_expanded
-        return mac
+        # Parsing the hex digits ourselves saves netaddr from trying
+        # out all the string formats it knows of
+        return netaddr.EUI(_hex_to_int(snmp_value[1:]), 48, dialect=netaddr.mac_unix_expanded)
 
     @staticmethod
     def snmp(python_value):
@@ -353,6 +503,10 @@ class IPv4Translator(Translator):
     4
     >>> IPv4Translator.pyvalue("Qkl9")
     IPAddress('81.107.108.57')
+    >>> IPv4Translator.pyvalue("$+c0a8046") # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError: non-hexadecimal number found in fromhex() arg
 
     """
     @staticmethod
@@ -365,7 +519,7 @@ class IPv4Translator(Translator):
         if python_value.version != 4:
             raise ValueError("%s is not an IPv4 address" % python_value)
 
-        return '$' + ''.join(["{0:02x}".format(w) for w in python_value.words])
+        return "${0:08x}".format(int(python_value))
 
     @staticmethod
     def pyvalue(snmp_value):
@@ -373,13 +527,11 @@ class IPv4Translator(Translator):
         if snmp_value in ["", "$00000000"]:
             return None
         if snmp_value.startswith('$') and len(snmp_value) == 9:
-            return netaddr.IPAddress(int(snmp_value[1:], 16))
+            return netaddr.IPAddress(_hex_to_int(snmp_value[1:]), 4)
 
         if len(snmp_value) == 4:
-            return netaddr.IPAddress(ord(snmp_value[0]) << 24 \
-                                     | ord(snmp_value[1]) << 16 \
-                                     | ord(snmp_value[2]) << 8 \
-                                     | ord(snmp_value[3]))
+            # Raw octets, one per character
+            return netaddr.IPAddress(int.from_bytes(snmp_value.encode('latin-1'), 'big'), 4)
 
         # ok. we have no idea of what it is...
         raise ValueError("Value '%s' is not an SNMP IPv4Address" % snmp_value)
@@ -404,6 +556,10 @@ class IPv6Translator(Translator):
     IPAddress('::c:fd8:400f:f558:0')
     >>> IPv6Translator.snmp(netaddr.IPAddress('::c:fd8:400f:f558:0'))
     '$0000000cfd8400ff55800'
+    >>> IPv6Translator.pyvalue('$0x00000000') # doctest: +IGNORE_EXCEPTION_DETAIL
+    Traceback (most recent call last):
+    ...
+    ValueError: non-hexadecimal number found in fromhex() arg
     """
     @staticmethod
     def snmp(python_value):
@@ -424,10 +580,13 @@ class IPv6Translator(Translator):
         if not snmp_value.startswith('$') or not 8 < len(snmp_value) <= 33:
             raise ValueError("Value '%s' is not an SNMP IPv6Address" % snmp_value)
 
-        if {x for x in snmp_value[1:]} == set('0'):   # All zeros
+        # Parsing validates the hex digits for us, and the result
+        # doubles as the all-zeros check
+        value = _hex_to_int(snmp_value[1:])
+        if not value:
             return None
 
-        res = netaddr.IPAddress(int(snmp_value[1:], 16), 6)
+        res = netaddr.IPAddress(value, 6)
         if res.version != 6:
             raise ValueError("Value '%s' is not an SNMP IPv6Address" % snmp_value)
         return res
@@ -467,6 +626,12 @@ class IPAddressTranslator(Translator):
     def snmp(python_value):
         if python_value is None:
             return "$00000000"
+        if isinstance(python_value, str):
+            # Go straight for the right version, rather than having
+            # netaddr try (and fail) IPv4 parsing on IPv6 addresses
+            if ':' in python_value:
+                return IPv6Translator.snmp(python_value)
+            return IPv4Translator.snmp(python_value)
         python_value = netaddr.IPAddress(python_value)
         if python_value.version == 4:
             return IPv4Translator.snmp(python_value)
@@ -482,6 +647,9 @@ class IPAddressTranslator(Translator):
             return IPv4Translator.pyvalue(snmp_value)
         return IPv6Translator.pyvalue(snmp_value)
 
+_DATETIME_STRUCT = struct.Struct('>HBBBBB')
+"Year, month, day-of-month, hour, minute, second - as used by DateTimeTranslator"
+
 class DateTimeTranslator(Translator):
     """
     Dates (such as the DHCP lease expiry time) are encoded somewhat stranger
@@ -502,6 +670,10 @@ class DateTimeTranslator(Translator):
 
     >>> DateTimeTranslator.pyvalue('')
 
+    >>> DateTimeTranslator.pyvalue('$07e4')
+    Traceback (most recent call last):
+    ...
+    ValueError: Value '$07e4' is not an SNMP DateTime
     >>> DateTimeTranslator.snmp(datetime.datetime(2018, 3, 14, 16, 7, 17))
     '$07e2030e10071100'
 
@@ -513,13 +685,9 @@ class DateTimeTranslator(Translator):
     def pyvalue(snmp_value):
         if snmp_value is None or snmp_value in ["", "$0000000000000000"]:
             return None
-        year = int(snmp_value[1:5], base=16)
-        month = int(snmp_value[5:7], base=16)
-        dom = int(snmp_value[7:9], base=16)
-        hour = int(snmp_value[9:11], base=16)
-        minute = int(snmp_value[11:13], base=16)
-        second = int(snmp_value[13:15], base=16)
-        return datetime.datetime(year, month, dom, hour, minute, second)
+        if len(snmp_value) < 15:
+            raise ValueError("Value '%s' is not an SNMP DateTime" % snmp_value)
+        return datetime.datetime(*_DATETIME_STRUCT.unpack(bytes.fromhex(snmp_value[1:15])))
 
     @staticmethod
     def snmp(python_value):
@@ -567,6 +735,23 @@ class RowStatus(HumaneEnum):
 
 RowStatusTranslator = EnumTranslator(RowStatus, snmp_datatype=DataType.INT)
 
+def _translated_docstring(oid, translator, doc):
+    """The doc string for a translated attribute/column"""
+    try:
+        translator_name = translator.__name__
+    except AttributeError:
+        try:
+            translator_name = translator.__class__.__name__
+        except AttributeError:
+            translator_name = translator.name
+
+    if doc:
+        return textwrap.dedent(doc) + \
+            "\n\nCorresponds to SNMP attribute {0}, translated by {1}" \
+            .format(oid, translator_name)
+    return "SNMP Attribute {0}, as translated by {1}" \
+        .format(oid, translator_name)
+
 class Attribute(RawAttribute):
     """A generic SNMP Attribute which can use a translator.
 
@@ -576,6 +761,9 @@ class Attribute(RawAttribute):
     between Python values and router representation.
 
     """
+    __doc__ = _AttributeDoc(__doc__)
+    __slots__ = ('_translator', '_doc')
+
     def __init__(self,
                  oid,
                  translator=NullTranslator,
@@ -583,24 +771,9 @@ class Attribute(RawAttribute):
                  value=None,
                  status=AttributeStatus.NEEDS_READ,
                  doc=None,
-                 readback_after_write=True):
+                 readback_after_write=None):
         self._translator = translator
-        try:
-            translator_name = translator.__name__
-        except AttributeError:
-            try:
-                translator_name = translator.__class__.__name__
-            except AttributeError:
-                translator_name = translator.name
-
-        if doc:
-            self.__doc__ = textwrap.dedent(doc) + \
-                "\n\nCorresponds to SNMP attribute {0}, translated by {1}" \
-                .format(oid, translator_name)
-        else:
-            self.__doc__ = "SNMP Attribute {0}, as translated by {1}" \
-                .format(oid, translator_name)
-
+        self._doc = doc
         if status == AttributeStatus.NEEDS_READ:
             RawAttribute.__init__(self,
                                   oid=oid,
@@ -617,6 +790,9 @@ class Attribute(RawAttribute):
                                   value=translator.snmp(value),
                                   readback_after_write=readback_after_write)
 
+    def _docstring(self):
+        return _translated_docstring(self._oid, self._translator, self._doc)
+
     def __get__(self, instance, owner):
         return self._translator.pyvalue(RawAttribute.__get__(self, instance, owner))
 
@@ -627,8 +803,88 @@ class Attribute(RawAttribute):
         return "{s.__class__.__name__}({s._oid}, {s._translator}, {s._status}, {s._value}" \
             .format(s=self)
 
+class Column(Writable):
+    """A column in an SNMP table.
+
+    This works much like an Attribute, but a single Column serves all
+    the rows in a table: The (raw) values are kept by the table, and
+    the Column translates them on the way in and out.
+
+    The full OID of a cell is the column OID followed by the row ID.
+
+    """
+    __doc__ = _AttributeDoc(__doc__)
+    __slots__ = ('_name', '_oid', '_translator', '_doc', '_built_doc')
+
+    def __init__(self,
+                 name,
+                 oid,
+                 translator=NullTranslator,
+                 doc=None,
+                 readback_after_write=None):
+        self._name = name
+        self._oid = oid
+        self._translator = translator
+        self._doc = doc
+        self._built_doc = None
+        Writable.__init__(self, readback_after_write)
+
+    @property
+    def name(self):
+        """The python attribute name of the column"""
+        return self._name
+
+    @property
+    def oid(self):
+        """The SNMP Object Identifier of the column"""
+        return self._oid
+
+    def _docstring(self):
+        return _translated_docstring(self._oid, self._translator, self._doc)
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        # pylint: disable=protected-access
+        raw_value = instance._table._column_values[self._name][instance._index]
+        if raw_value is None:
+            raise AttributeError("Row has no value for '{0}'".format(self._name))
+        return self._translator.pyvalue(raw_value)
+
+    def __set__(self, instance, value):
+        raw_value = self._translator.snmp(value)
+        # pylint: disable=protected-access
+        _snmp_write(instance,
+                    self._oid + '.' + instance._row_id,
+                    raw_value,
+                    self._translator.snmp_datatype,
+                    self._readback())
+        instance._table._column_values[self._name][instance._index] = raw_value
+
+    def __delete__(self, instance):
+        raise NotImplementedError("Deleting SNMP values do not make sense")
+
+    def __str__(self):
+        return "{s.__class__.__name__}({s._name}, {s._oid}, {s._translator})" \
+            .format(s=self)
+
 class TransportProxy:
-    """Forwards snmp_get/snmp_set calls to another class/instance."""
+    """Forwards snmp_get/snmp_set calls to another class/instance.
+
+    The transport's methods are bound directly, so there is no extra
+    call layer - and keyword arguments arrive untouched:
+
+    >>> class EchoTransport:
+    ...     def snmp_get(self, oid): return oid
+    ...     def snmp_set(self, oid, value=None, datatype=None): return (oid, value, datatype)
+    ...     def snmp_walk(self, oid): return {oid: "x"}
+    >>> proxy = TransportProxy(EchoTransport())
+    >>> proxy.snmp_set("1.2.3", datatype=DataType.INT, value="7")
+    ('1.2.3', '7', <DataType.INT: 2>)
+    >>> proxy.snmp_get(oid="1.2.3")
+    '1.2.3'
+
+    """
     def __init__(self, transport):
         """Create a TransportProxy which forwards to the given transport"""
         self._transport = transport
@@ -641,11 +897,38 @@ class TransportProxyDict(TransportProxy, dict):
         TransportProxy.__init__(self, transport)
         dict.__init__(self)
 
-class RowBase(TransportProxy):
-    """Base class for representing SNMP Tables"""
-    def __init__(self, proxy, keys):
-        super().__init__(proxy)
-        self._keys = keys
+class RowBase:
+    """Base class for representing rows in SNMP Tables
+
+    A row only knows its table and its index in it: The table keeps
+    the raw SNMP values column by column, and the Column attributes
+    of the (table specific) subclass read and translate them from
+    there.
+
+    """
+    __slots__ = ('_table', '_row_id', '_index')
+
+    def __init__(self, table, row_id, index):
+        self._table = table
+        self._row_id = row_id
+        self._index = index
+
+    # Looked up via the table when a column is written, rather than
+    # bound into every row
+    @property
+    def snmp_get(self):
+        """The snmp_get of the table's transport"""
+        return self._table.snmp_get
+
+    @property
+    def snmp_set(self):
+        """The snmp_set of the table's transport"""
+        return self._table.snmp_set
+
+    @property
+    def _keys(self):
+        # pylint: disable=protected-access
+        return self._table._row_keys(self._index)
 
     def keys(self):
         return self._keys
@@ -668,41 +951,36 @@ class RowBase(TransportProxy):
         return default
 
     def __iter__(self):
-        return self.keys().iter()
+        return iter(self._keys)
 
     def __contains__(self, item):
         return item in self._keys
 
     def __str__(self):
-        return self.__class__.__name__ + '(' \
-            + ', '.join(["{0}={1}".format(key, str(getattr(self, key)))
-                         for key in self._keys]) \
-            + ')'
+        return "{0}({1})".format(self.__class__.__name__,
+                                 ', '.join("{0}={1!s}".format(key, getattr(self, key))
+                                           for key in self._keys))
 
     def __repr__(self):
-        return self.__class__.__name__ + '(' \
-            + ', '.join(["{0}={1}".format(key, repr(getattr(self, key)))
-                         for key in self._keys]) \
-            + ')'
+        return "{0}({1})".format(self.__class__.__name__,
+                                 ', '.join("{0}={1!r}".format(key, getattr(self, key))
+                                           for key in self._keys))
 
 def parse_table(table_oid, walk_result):
     """Restructure the result of an SNMP table into rows and columns
 
-    """
-    def column_id(oid):
-        return oid[len(table_oid)+1:].split('.')[0]
-
-    def row_id(oid):
-        return '.'.join(oid[len(table_oid)+1:].split('.')[1:])
+    >>> parse_table("1.2", {"1.2.1.1": "a", "1.2.2.1": "b", "1.2.1.4.5": "c"})
+    {'1': {'1': 'a', '2': 'b'}, '4.5': {'1': 'c'}}
 
-    result_dict = dict()
+    """
+    prefix_len = len(table_oid) + 1
+    result_dict = collections.defaultdict(dict)
     for oid, raw_value in walk_result.items():
-        this_column_id = column_id(oid)
-        this_row_id = row_id(oid)
-        if this_row_id not in result_dict:
-            result_dict[this_row_id] = dict()
-        result_dict[this_row_id][this_column_id] = raw_value
-    return result_dict
+        column_id, _, row_id = oid[prefix_len:].partition('.')
+        # There are only a handful of distinct column ids, and they
+        # end up as keys in every row
+        result_dict[row_id][sys.intern(column_id)] = raw_value
+    return dict(result_dict)
 
 class Table(TransportProxyDict):
     """A pythonic representation of an SNMP table
@@ -711,14 +989,19 @@ class Table(TransportProxyDict):
     as each entry in the table has an ID: the ID becomes the key of
     the resulting dict.
 
-    Each entry in the result is a (customised) RowBase class, where
-    SNMP attributes are mapped to Attribute instances: Updates to the
-    attributes will result in the hub being updated.
+    Each entry in the result is an instance of a (customised) RowBase
+    class, where SNMP columns are mapped to Column attributes: Updates
+    to the attributes will result in the hub being updated.
 
     Although the resulting table is updateable (updates to attributes
     in the row will result in SNMP Set calls), the table does not
     support deletion or insertion of elements: it is of fixed size.
 
+    The table keeps the raw SNMP values, and the rows are just light
+    references into it: Values are only translated when they are read,
+    so looking at a few rows of a large table does not pay for
+    translating all of them.
+
     The column_mapping describes how to translate OID columns to
     Python values in the resulting rows:
 
@@ -745,7 +1028,75 @@ class Table(TransportProxyDict):
                     used.
 
     - "doc": (optional) the doc string to associate with the attribute.
+
+    - "readback_after_write": (optional) Whether to read the value back
+                              after writing it. Defaults to
+                              Writable.verify_writes.
+
+    Subclasses for a specific table set TABLE_OID, and take just the
+    transport (and optionally a walk_result) - see walk_many().
+
+    For example, with a (fake) transport holding a two-column table:
+
+    >>> class Transport:
+    ...     def __init__(self):
+    ...         self.sets = []
+    ...     def snmp_get(self, oid):
+    ...         raise KeyError(oid)
+    ...     def snmp_set(self, oid, value=None, datatype=None):
+    ...         self.sets.append((oid, value))
+    ...     def snmp_walk(self, oid):
+    ...         return {"1.2.1.7": "$c0a80001", "1.2.2.7": "80", "1.2.1.8": "$c0a80002"}
+    >>> transport = Transport()
+    >>> table = Table(transport, "1.2",
+    ...               {"1": {"name": "addr", "translator": IPv4Translator},
+    ...                "2": {"name": "port", "translator": IntTranslator}})
+    >>> table["7"].addr, table["7"].port
+    (IPAddress('192.168.0.1'), 80)
+    >>> table["8"].port
+    Traceback (most recent call last):
+    ...
+    AttributeError: Row has no value for 'port'
+    >>> table["7"].port = 8080
+    >>> transport.sets
+    [('1.2.2.7', '8080')]
+    >>> table["7"].port
+    8080
+    >>> row = table.new_row("9", port=22, addr="10.0.0.1")
+    >>> transport.sets[1:]
+    [('1.2.1.9', '$0a000001'), ('1.2.2.9', '22')]
+    >>> row.port
+    22
+
+    Only the values which are read get translated:
+
+    >>> class LoudTranslator(NullTranslator):
+    ...     @staticmethod
+    ...     def pyvalue(snmp_value):
+    ...         print("translating", snmp_value)
+    ...         return snmp_value
+    >>> table = Table(Transport(), "1.2", {"1": {"name": "addr", "translator": LoudTranslator}})
+    >>> len(table)
+    2
+    >>> table["8"].addr
+    translating $c0a80002
+    '$c0a80002'
+
+    The rows are proper rows, also to the rest of the dict API:
+
+    >>> table = Table(Transport(), "1.2",
+    ...               {"1": {"name": "addr", "translator": IPv4Translator},
+    ...                "2": {"name": "port", "translator": IntTranslator}})
+    >>> str(table["8"])
+    'Row(addr=192.168.0.2)'
+    >>> table
+    {'7': Row(addr=IPAddress('192.168.0.1'), port=80), '8': Row(addr=IPAddress('192.168.0.2'))}
+    >>> print(table.copy().pop("7"))
+    Row(addr=192.168.0.1, port=80)
     """
+    TABLE_OID = None
+    "The OID of the table, for subclasses representing a specific table"
+
     def __init__(self,
                  transport,
                  table_oid,
@@ -757,10 +1108,26 @@ class Table(TransportProxyDict):
         """
         super().__init__(transport)
         self._oid = table_oid
-        self._row_class = row_class
         self._column_mapping = column_mapping
 
-        if not walk_result:
+        # Digest the column mapping once, so the per-row work below
+        # does not need to look into it
+        self._columns = tuple(
+            (column_id,
+             Column(name=mapping["name"],
+                    oid=table_oid + '.' + column_id,
+                    translator=mapping.get('translator', NullTranslator),
+                    doc=mapping.get('doc'),
+                    readback_after_write=mapping.get('readback_after_write')))
+            for column_id, mapping in column_mapping.items())
+
+        # All rows have the same layout, so they can share a single
+        # class: The values are kept by the table.
+        row_class_dict = {column.name: column for _, column in self._columns}
+        row_class_dict['__slots__'] = ()
+        self._row_class = type('Row', (row_class,), row_class_dict)
+
+        if walk_result is None:
             walk_result = transport.snmp_walk(table_oid)
 
         if not walk_result:
@@ -768,52 +1135,60 @@ class Table(TransportProxyDict):
 
         rawtable = parse_table(table_oid, walk_result)
 
-        result_dict = dict()
+        # The raw values are kept column by column - one list per
+        # column name, with None where a row lacks the column - and
+        # each row just refers to its index in the lists.
+        self._column_values = {column.name: [] for _, column in self._columns}
+        self._row_count = 0
         for row_id, row in rawtable.items():
-            result_dict[row_id] = dict()
-            for column_id, raw_value in row.items():
-                if not column_id in column_mapping:
-                    continue
-                result_dict[row_id][column_id] = (table_oid + '.' + column_id + '.' + row_id,
-                                                  raw_value,
-                                                  column_mapping[column_id])
-            if not result_dict[row_id]:
-                del result_dict[row_id]
-
-        # Then go through the result, and create a row object for each
-        # row. Essentially, each row is a different class, as it may
-        # have different attributes
-        for rowkey, row in result_dict.items():
-            # Build up the columns in the row
-            class_dict = {
-                mapping["name"]: Attribute(oid=oid,
-                                           translator=mapping.get('translator', NullTranslator),
-                                           instance=self,
-                                           value=mapping.get('translator',
-                                                             NullTranslator).pyvalue(raw_value),
-                                           status=AttributeStatus.OK,
-                                           readback_after_write=mapping.get("readback_after_write",
-                                                                            True),
-                                           doc=mapping.get('doc'))
-                for oid, raw_value, mapping in row.values()
-            }
-            if not class_dict:
+            cells = [row.get(column_id) for column_id, _ in self._columns]
+            if all(cell is None for cell in cells):
                 # Empty rows are not interesting...
                 continue
-            # A litle trick: Redo it with a new dict, so we can get
-            # the order "right" - i.e. the order it is done in the
-            # mappings
-            class_dict = {column['name']: class_dict[column['name']]
-                          for column in column_mapping.values()
-                          if column['name'] in class_dict}
-
-            RowClass = type('Row', (self._row_class,), class_dict)
-            self[rowkey] = RowClass(self, class_dict)
+            self[row_id] = self._row_class(self, row_id, self._append_cells(cells))
 
         if not self:
             warnings.warn("SMTP walk of %s resulted in zero rows"
                           % table_oid)
 
+    @staticmethod
+    def walk_many(transport, table_classes, max_workers=10):
+        """Instantiate several tables, walking them concurrently.
+
+        table_classes is a sequence of Table subclasses for specific
+        tables - i.e. classes which set TABLE_OID and take a
+        (transport, walk_result=None) constructor, like the ones in
+        arris.py. The SNMP walks are what takes the time, so they are
+        done in parallel - with at most max_workers outstanding
+        requests, as the hub is easily overloaded.
+
+        The resulting tables are returned as a list, in the same order
+        as requested.
+
+        >>> class Transport:
+        ...     def snmp_get(self, oid): pass
+        ...     def snmp_set(self, oid, value, datatype=None): pass
+        ...     def snmp_walk(self, oid):
+        ...         return {oid + ".1.1": oid}
+        >>> class TableA(Table):
+        ...     TABLE_OID = "1.2"
+        ...     def __init__(self, transport, walk_result=None):
+        ...         super().__init__(transport, self.TABLE_OID, {"1": {"name": "a"}},
+        ...                          walk_result=walk_result)
+        >>> class TableB(TableA):
+        ...     TABLE_OID = "1.3"
+        >>> Table.walk_many(Transport(), [TableA, TableB])
+        [{'1': Row(a='1.2')}, {'1': Row(a='1.3')}]
+
+        """
+        table_classes = list(table_classes)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            walk_results = list(executor.map(transport.snmp_walk,
+                                             [table_class.TABLE_OID
+                                              for table_class in table_classes]))
+        return [table_class(transport, walk_result=walk_result)
+                for table_class, walk_result in zip(table_classes, walk_results)]
+
     @property
     def oid(self):
         """The base OID of the table, as passed to the contructor"""
@@ -831,28 +1206,19 @@ class Table(TransportProxyDict):
         if row_key in self:
             raise ValueError("Key '%s' already exists in table" % row_key)
 
-        mapping_names = [mapping["name"] for mapping in self._column_mapping.values()]
+        mapping_names = [column.name for _, column in self._columns]
 
         for arg in kwargs:
             if arg not in mapping_names:
                 raise TypeError("Invalid kwarg name '%s' - "
                                 "expected one of %s" % (arg, mapping_names))
 
-        rowclass_dict = {
-            mapping["name"]: Attribute(
-                oid=self.oid + '.' + column_oid + '.' + row_key,
-                doc=mapping.get('doc'),
-                instance=self,
-                value=kwargs[mapping["name"]],
-                status=AttributeStatus.NEEDS_WRITE,
-                translator=mapping.get('translator', NullTranslator),
-                readback_after_write=mapping.get('readback_after_write', True)
-            )
-            for column_oid, mapping in self._column_mapping.items()
-            if mapping["name"] in kwargs
-        }
-        RowClass = type('Row', (self._row_class,), rowclass_dict)
-        therow = RowClass(self, rowclass_dict)
+        therow = self._row_class(self, row_key,
+                                 self._append_cells([None] * len(self._columns)))
+        # Write the columns in the order of the mapping
+        for name in mapping_names:
+            if name in kwargs:
+                setattr(therow, name, kwargs[name])
 
         self[row_key] = therow
         return therow
@@ -895,6 +1261,25 @@ class Table(TransportProxyDict):
         """
         return self.values()
 
+    def _append_cells(self, cells):
+        """Store the raw values of a new row - in the order of the
+        columns - returning the index of the row"""
+        for column_values, cell in zip(self._column_values.values(), cells):
+            column_values.append(cell)
+        self._row_count += 1
+        return self._row_count - 1
+
+    def _row_keys(self, index):
+        """The names of the columns the row at index has values for.
+
+        These are in the order of the mapping, which is the order the
+        columns will be shown in.
+
+        """
+        return [name
+                for name, column_values in self._column_values.items()
+                if column_values[index] is not None]
+
     def __delitem__(self, key):
         if key in self and hasattr(self[key], 'rowstatus'):
             self[key].rowstatus = RowStatus.DESTROY
@@ -903,7 +1288,6 @@ class Table(TransportProxyDict):
 
 def _run_tests():
     import doctest
-    import sys
 
     fail_count, test_count = doctest.testmod(report=True)
     if fail_count:
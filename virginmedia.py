@@ -14,6 +14,7 @@ import os
 import os.path
 import random
 import textwrap
+import threading
 import time
 import warnings
 
@@ -69,6 +70,7 @@ class Hub:
     """
     def __init__(self, hostname='192.168.0.1', http_timeout=30, **kwargs):
         self._credential = None
+        self._login_lock = threading.Lock()
         self._url = 'http://' + hostname
         self._hostname = hostname
         self._username = None
@@ -99,13 +101,52 @@ class Hub:
         This also tries to work around bugs in the Virgin Media Hub3
         firmware: Requests can (randomly?) fail with HTTP status 401
         (Unauthorized) for no apparent reason.  Logging in again before
-        retrying usually solves that.
+        retrying usually solves that.  As several threads may hit this
+        at once (e.g. when walking tables concurrently), only the first
+        of them to see the 401 logs in again - the others retry with
+        the new credential.
+
+        >>> from unittest import mock
+        >>> hub = Hub()
+        >>> hub._credential = "old"
+        >>> statuses = [401, 200]
+        >>> def fake_get(url, cookies=None, **kwargs):
+        ...     print("GET", url, cookies)
+        ...     return mock.Mock(status_code=statuses.pop(0))
+        >>> def fake_login(username=None, password=None):
+        ...     print("login")
+        ...     hub._credential = "new"
+        >>> with mock.patch("requests.get", fake_get), \\
+        ...         mock.patch.object(hub, "login", fake_login), \\
+        ...         warnings.catch_warnings():
+        ...     warnings.simplefilter("ignore")
+        ...     hub._get("foo").status_code
+        GET http://192.168.0.1/foo {'credential': 'old'}
+        login
+        GET http://192.168.0.1/foo {'credential': 'new'}
+        200
+
+        If another thread logged in again while the request was under
+        way, the request is just retried with the new credential:
+
+        >>> statuses = [401, 200]
+        >>> def racing_get(url, cookies=None, **kwargs):
+        ...     hub._credential = "newer"
+        ...     return fake_get(url, cookies, **kwargs)
+        >>> with mock.patch("requests.get", racing_get), \\
+        ...         mock.patch.object(hub, "login", fake_login):
+        ...     hub._get("foo").status_code
+        GET http://192.168.0.1/foo {'credential': 'new'}
+        GET http://192.168.0.1/foo {'credential': 'newer'}
+        200
+        >>> hub._credential = None
         """
         sleep = 1
         while True:
-            if self._credential:
+            credential = self._credential
+            if credential:
                 resp = requests.get(self._url + '/' + url,
-                                    cookies={"credential": self._credential},
+                                    cookies={"credential": credential},
                                     timeout=self.http_timeout,
                                     **kwargs)
             else:
@@ -115,9 +156,11 @@ class Hub:
             if resp.status_code == 401:
                 retry401 -= 1
                 if retry401 > 0 and self.is_loggedin:
-                    warnings.warn("Got http status %s - Retrying after logging in again" \
-                                  %(resp.status_code))
-                    self.login(username=self._username, password=self._password)
+                    with self._login_lock:
+                        if self._credential == credential:
+                            warnings.warn("Got http status %s - Retrying after logging in again" \
+                                          %(resp.status_code))
+                            self.login(username=self._username, password=self._password)
                     continue
             if resp.status_code == 500:
                 retry500 -= 1
@@ -346,6 +389,17 @@ class Hub:
         return result
 
 
+    def walk_tables(self, *table_classes):
+        """Retrieve several tables at once.
+
+        The table classes (e.g. arris.LanClientTable) are walked
+        concurrently, which is a lot quicker than reading the
+        corresponding properties one by one.  The tables are returned
+        as a list in the same order.
+
+        """
+        return snmp.Table.walk_many(self, table_classes)
+
     @property
     def wan_networks(self):
         """List of WAN networks
@@ -494,11 +548,13 @@ def _demo():
                 print("Problem with property", name)
                 raise
 
+        portforwards, clients = hub.walk_tables(arris.PortForwardTable,
+                                                arris.LanClientTable)
         print("Port Forwardings")
-        print(hub.portforwards.format())
+        print(portforwards.format())
 
         print("Clients:")
-        print(utils.format_table(hub.clients))
+        print(utils.format_table(clients))
 
 if __name__ == '__main__':
     _demo()